@@ -1,5 +1,7 @@
 """Tests for the create_validator agent."""
 
+import asyncio
+import time
 from typing import cast
 from unittest.mock import patch
 
@@ -9,13 +11,19 @@ from pydantic_ai.models.test import TestModel
 
 from determystic.agents.create_validator import (
     AgentDependencies,
+    DEFAULT_REQUIREMENTS,
     EditFileInput,
     FinalizeInput,
     ReadExternalFileInput,
     ReadFileInput,
     RunTestsInput,
+    TASK_PROMPT_TEMPLATE,
+    WriteAndTestInput,
     WriteFileInput,
+    WriteFilesInput,
+    _build_task_prompt,
     create_ast_validator,
+    create_ast_validators_batch,
     read_external_file,
     stream_create_validator,
 )
@@ -212,6 +220,53 @@ class TestCreateValidator:
             # TestModel doesn't call tools, so no environment interaction expected
             # Real tool integration is tested in test_real_tool_integration_end_to_end
 
+    @pytest.mark.asyncio
+    async def test_create_ast_validators_batch_bounds_concurrency(
+        self,
+        mock_anthropic_client,
+    ):
+        """Batched runs respect the concurrency limit and keep input order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_create(user_code, requirements, anthropic_client):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"summary {user_code}", f"validator {requirements}", "tests"
+
+        items: list[tuple[str, str | None]] = [(f"code{i}", f"req{i}") for i in range(5)]
+
+        with patch(
+            "determystic.agents.create_validator._run_validator_agent",
+            side_effect=fake_create,
+        ):
+            results = await create_ast_validators_batch(
+                items,
+                anthropic_client=mock_anthropic_client,
+                concurrency=2,
+            )
+
+        assert max_in_flight == 2
+        assert [result[0] for result in results] == [f"summary code{i}" for i in range(5)]
+        assert [result[1] for result in results] == [f"validator req{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_create_ast_validators_batch_rejects_invalid_concurrency(
+        self,
+        mock_anthropic_client,
+    ):
+        """A concurrency below one fails fast instead of hanging the batch."""
+        for concurrency in (0, -1):
+            with pytest.raises(ValueError, match="concurrency must be at least 1"):
+                await create_ast_validators_batch(
+                    [("code", None)],
+                    anthropic_client=mock_anthropic_client,
+                    concurrency=concurrency,
+                )
+
     @pytest.mark.asyncio
     async def test_real_tool_integration_end_to_end(self):
         """Test that our tools work end-to-end with realistic agent behavior."""
@@ -384,6 +439,201 @@ def test_clean_function():
         for filename, content in deps.files.items():
             print(f"  📄 {filename}: {len(content)} characters")
 
+    @pytest.mark.asyncio
+    async def test_run_tests_reuses_one_isolated_env_per_run(self):
+        """Repeated test runs share one isolated environment until it is closed."""
+        from determystic.agents.create_validator import run_tests
+
+        deps = AgentDependencies()
+        deps.validation_contents = "validator"
+        deps.test_contents = "tests"
+
+        class MockRunContext:
+            def __init__(self, deps):
+                self.deps = deps
+
+        ctx = cast(RunContext[AgentDependencies], MockRunContext(deps))
+
+        with patch('determystic.agents.create_validator.IsolatedEnv') as mock_env:
+            mock_env_instance = mock_env.return_value.__enter__.return_value
+            mock_env_instance.run_tests.return_value = (True, "All tests passed")
+
+            await run_tests(ctx, RunTestsInput())
+            deps.test_contents = "updated tests"
+            await run_tests(ctx, RunTestsInput())
+
+            assert mock_env.call_count == 1
+            assert mock_env_instance.run_tests.call_count == 2
+
+            await deps.aclose_env()
+            await deps.aclose_env()
+
+            mock_env_instance.__exit__.assert_called_once_with(None, None, None)
+
+    @pytest.mark.asyncio
+    async def test_run_tests_caches_results_for_unchanged_files(self):
+        """Re-running identical files answers from the cache without pytest."""
+        from determystic.agents.create_validator import run_tests
+
+        deps = AgentDependencies()
+        deps.validation_contents = "validator"
+        deps.test_contents = "tests"
+
+        class MockRunContext:
+            def __init__(self, deps):
+                self.deps = deps
+
+        ctx = cast(RunContext[AgentDependencies], MockRunContext(deps))
+
+        with patch('determystic.agents.create_validator.IsolatedEnv') as mock_env:
+            mock_env_instance = mock_env.return_value.__enter__.return_value
+            mock_env_instance.last_run_completed = True
+            mock_env_instance.run_tests.return_value = (False, "1 failed")
+
+            first = await run_tests(ctx, RunTestsInput())
+            second = await run_tests(ctx, RunTestsInput())
+
+            await deps.aclose_env()
+
+        assert first == "❌ Tests failed:\n\n1 failed"
+        assert second == "❌ Tests failed: (cached)\n\n1 failed"
+        assert mock_env_instance.run_tests.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_run_tests_does_not_cache_timeouts(self):
+        """Runs where pytest never reported a verdict are retried, not replayed."""
+        from determystic.agents.create_validator import run_tests
+
+        deps = AgentDependencies()
+        deps.validation_contents = "validator"
+        deps.test_contents = "tests"
+
+        class MockRunContext:
+            def __init__(self, deps):
+                self.deps = deps
+
+        ctx = cast(RunContext[AgentDependencies], MockRunContext(deps))
+
+        with patch('determystic.agents.create_validator.IsolatedEnv') as mock_env:
+            mock_env_instance = mock_env.return_value.__enter__.return_value
+            mock_env_instance.last_run_completed = False
+            mock_env_instance.run_tests.return_value = (False, "Test execution timed out")
+
+            first = await run_tests(ctx, RunTestsInput())
+            second = await run_tests(ctx, RunTestsInput())
+
+            await deps.aclose_env()
+
+        assert first == second == "❌ Tests failed:\n\nTest execution timed out"
+        assert mock_env_instance.run_tests.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_run_tests_share_the_env_one_at_a_time(self):
+        """Tool calls from one response never run in the shared environment together."""
+        from determystic.agents.create_validator import run_tests
+
+        deps = AgentDependencies()
+        deps.validation_contents = "validator"
+        deps.test_contents = "tests"
+
+        class MockRunContext:
+            def __init__(self, deps):
+                self.deps = deps
+
+        ctx = cast(RunContext[AgentDependencies], MockRunContext(deps))
+        active: list[int] = []
+        overlaps: list[int] = []
+
+        def fake_run_tests(validator_code: str, test_code: str) -> tuple[bool, str]:
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+            return True, test_code
+
+        with patch('determystic.agents.create_validator.IsolatedEnv') as mock_env:
+            mock_env_instance = mock_env.return_value.__enter__.return_value
+            mock_env_instance.run_tests.side_effect = fake_run_tests
+
+            first = asyncio.create_task(run_tests(ctx, RunTestsInput()))
+            await asyncio.sleep(0)
+            deps.test_contents = "other tests"
+            second = asyncio.create_task(run_tests(ctx, RunTestsInput()))
+            results = await asyncio.gather(first, second)
+
+            await deps.aclose_env()
+
+        assert overlaps == [1, 1]
+        assert results == ["✅ Tests passed!\n\ntests", "✅ Tests passed!\n\nother tests"]
+
+    @pytest.mark.asyncio
+    async def test_write_files_writes_each_file_in_one_call(self):
+        """The batch write tool stores valid files and reports invalid names."""
+        from determystic.agents.create_validator import write_files
+
+        deps = AgentDependencies()
+
+        class MockRunContext:
+            def __init__(self, deps):
+                self.deps = deps
+
+        ctx = cast(RunContext[AgentDependencies], MockRunContext(deps))
+
+        result = await write_files(
+            ctx,
+            WriteFilesInput(files=[
+                WriteFileInput(filename="validator.py", content="validator"),
+                WriteFileInput(filename="test_validator.py", content="tests"),
+                WriteFileInput(filename="other.py", content="ignored"),
+            ]),
+        )
+
+        assert deps.files == {"validator.py": "validator", "test_validator.py": "tests"}
+        lines = result.splitlines()
+        assert lines[0] == "✅ File 'validator.py' written (9 characters)"
+        assert lines[1] == "✅ File 'test_validator.py' written (5 characters)"
+        assert lines[2].startswith("❌ Invalid filename 'other.py'")
+
+        result = await write_files(
+            ctx,
+            WriteFilesInput(files=[
+                WriteFileInput(filename="validator.py", content="validator"),
+            ]),
+        )
+
+        assert result == "✅ File 'validator.py' unchanged (9 characters)"
+
+    @pytest.mark.asyncio
+    async def test_write_and_test_stores_both_files_and_runs_tests(self):
+        """The compound tool writes both files and runs them in one call."""
+        from determystic.agents.create_validator import write_and_test
+
+        deps = AgentDependencies()
+
+        class MockRunContext:
+            def __init__(self, deps):
+                self.deps = deps
+
+        ctx = cast(RunContext[AgentDependencies], MockRunContext(deps))
+
+        with patch('determystic.agents.create_validator.IsolatedEnv') as mock_env:
+            mock_env_instance = mock_env.return_value.__enter__.return_value
+            mock_env_instance.run_tests.return_value = (False, "1 failed")
+
+            result = await write_and_test(
+                ctx,
+                WriteAndTestInput(validator="validator", tests="tests"),
+            )
+
+            await deps.aclose_env()
+
+        assert deps.files == {"validator.py": "validator", "test_validator.py": "tests"}
+        assert result == "❌ Tests failed:\n\n1 failed"
+        mock_env_instance.run_tests.assert_called_once_with(
+            validator_code="validator",
+            test_code="tests",
+        )
+
     # determystic: tested-exceptions[determystic.agents.create_validator.read_external_file: Exception]
     @pytest.mark.asyncio
     async def test_read_external_file_reports_read_errors(self):
@@ -403,6 +653,21 @@ def test_clean_function():
         assert "cannot read" in result
 
 
+def test_build_task_prompt_matches_template_format():
+    """The pre-split task prompt renders exactly like the template."""
+    user_code = "value: Optional[str] = None  # {not a placeholder}"
+    requirements = "Don't use Optional[T]"
+
+    assert _build_task_prompt(user_code, requirements) == TASK_PROMPT_TEMPLATE.format(
+        user_code=user_code,
+        requirements=requirements,
+    )
+    assert _build_task_prompt(user_code, None) == TASK_PROMPT_TEMPLATE.format(
+        user_code=user_code,
+        requirements=DEFAULT_REQUIREMENTS,
+    )
+
+
 if __name__ == "__main__":
     # Run the test
     pytest.main([__file__, "-v"])
@@ -58,6 +58,7 @@ def test_read_generated_files_from_workspace(tmp_path: Path) -> None:
     assert "def test_validator" in tests
 
 
+# determystic: tested-exceptions[determystic.agents.local_agent._read_optional_text: FileNotFoundError]
 def test_read_generated_files_requires_workspace_files(tmp_path: Path) -> None:
     """Local agents must write both generated files to the temporary workspace."""
     (tmp_path / "validator.py").write_text("from determystic.external import DeterministicTraverser\n")
@@ -1,5 +1,7 @@
 """Tests for the interactive new-validator command."""
 
+import io
+import json
 from types import SimpleNamespace
 from typing import Awaitable, Callable, cast
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -71,7 +73,9 @@ async def test_new_validator_command_reports_save_errors() -> None:
         ),
         patch("determystic.cli.ui.confirm", new=AsyncMock(return_value=True)),
         patch("determystic.cli.new_validator.console.print") as mock_print,
+        patch("determystic.cli.new_validator.sys.stdin") as mock_stdin,
     ):
+        mock_stdin.isatty.return_value = True
         with patch(
             "determystic.cli.new_validator.stream_create_validator_with_local_agent",
             new=fake_stream_create_validator_with_local_agent,
@@ -80,3 +84,91 @@ async def test_new_validator_command_reports_save_errors() -> None:
 
     config.save_to_disk.assert_not_called()
     assert "Error saving validator files: disk full" in str(mock_print.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_new_validator_command_reads_scripted_request_from_stdin() -> None:
+    """Piped stdin supplies every field at once and skips the interactive prompts."""
+    config = SimpleNamespace(
+        settings=SimpleNamespace(validator_agent="codex"),
+        get_custom_validators=MagicMock(return_value={}),
+        new_validation=MagicMock(
+            return_value=SimpleNamespace(validator_path="v.py", test_path="t.py")
+        ),
+        save_to_disk=MagicMock(),
+    )
+    deps = AgentDependencies()
+    deps.validation_contents = "validator code"
+    deps.test_contents = "test code"
+    seen_requests: list[dict] = []
+
+    async def fake_stream_create_validator_with_local_agent(*args, **kwargs):
+        seen_requests.append(kwargs)
+        yield StreamEvent(event_type="final_result", content="done", deps=deps)
+
+    payload = json.dumps({"code": "x: Optional[int]\n", "issues": "flag Optional", "name": "no optional"})
+    confirm = AsyncMock()
+    with (
+        patch("determystic.cli.new_validator.ProjectConfigManager.load_from_disk", return_value=config),
+        patch("determystic.cli.new_validator.select_local_agent", return_value="codex"),
+        patch("determystic.cli.new_validator.sys.stdin", io.StringIO(payload)),
+        patch("determystic.cli.ui.confirm", new=confirm),
+        patch("determystic.cli.new_validator.console.print"),
+        patch(
+            "determystic.cli.new_validator.stream_create_validator_with_local_agent",
+            new=fake_stream_create_validator_with_local_agent,
+        ),
+    ):
+        await _invoke_new_validator_command()
+
+    confirm.assert_not_called()
+    assert seen_requests[0]["user_code"] == "x: Optional[int]"
+    assert seen_requests[0]["requirements"] == "flag Optional"
+    assert config.new_validation.call_args.kwargs["name"] == "no-optional"
+    config.save_to_disk.assert_called_once()
+
+
+# determystic: tested-exceptions[determystic.cli.new_validator._read_scripted_request: JSONDecodeError]
+@pytest.mark.asyncio
+async def test_new_validator_command_rejects_invalid_scripted_json() -> None:
+    """Malformed piped input exits with an error instead of a traceback."""
+    config = SimpleNamespace(settings=SimpleNamespace(validator_agent="codex"))
+
+    with (
+        patch("determystic.cli.new_validator.ProjectConfigManager.load_from_disk", return_value=config),
+        patch("determystic.cli.new_validator.select_local_agent", return_value="codex"),
+        patch("determystic.cli.new_validator.sys.stdin", io.StringIO("not json")),
+        patch("determystic.cli.new_validator.sys.exit", side_effect=SystemExit(1)) as mock_exit,
+        patch("determystic.cli.new_validator.console.print") as mock_print,
+    ):
+        with pytest.raises(SystemExit):
+            await _invoke_new_validator_command()
+
+    mock_exit.assert_called_once_with(1)
+    assert "Expected a JSON object on stdin" in str(mock_print.call_args_list)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload", "message"),
+    [
+        ({"code": None}, "No code provided"),
+        ({"code": "x = 1", "name": 42}, "string code, issues and name fields"),
+    ],
+)
+async def test_new_validator_command_validates_scripted_fields(payload, message) -> None:
+    """Null code counts as missing and non-string fields are rejected."""
+    config = SimpleNamespace(settings=SimpleNamespace(validator_agent="codex"))
+
+    with (
+        patch("determystic.cli.new_validator.ProjectConfigManager.load_from_disk", return_value=config),
+        patch("determystic.cli.new_validator.select_local_agent", return_value="codex"),
+        patch("determystic.cli.new_validator.sys.stdin", io.StringIO(json.dumps(payload))),
+        patch("determystic.cli.new_validator.sys.exit", side_effect=SystemExit(1)) as mock_exit,
+        patch("determystic.cli.new_validator.console.print") as mock_print,
+    ):
+        with pytest.raises(SystemExit):
+            await _invoke_new_validator_command()
+
+    mock_exit.assert_called_once_with(1)
+    assert message in str(mock_print.call_args_list)
@@ -1,13 +1,19 @@
 """Tests for the shared CLI UI primitives."""
 
+import asyncio
+import io
 from unittest.mock import patch
 
 import pytest
 from prompt_toolkit.keys import Keys
+from rich.console import Console
 
 from determystic.agents.create_validator import AgentDependencies, StreamEvent
 from determystic.cli.ui import (
+    THEME,
     _editing_key_bindings,
+    code_block,
+    code_preview,
     confirm,
     multiline_input,
     render_agent_stream,
@@ -38,12 +44,26 @@ async def test_multiline_input_handles_terminal_interrupts() -> None:
 
     for exception in (EOFError(), KeyboardInterrupt()):
         with (
+            patch("determystic.cli.ui.sys.stdin") as mock_stdin,
             patch("determystic.cli.ui.PromptSession", return_value=FailingSession(exception)),
             patch("determystic.cli.ui.console.print"),
         ):
+            mock_stdin.isatty.return_value = True
             assert await multiline_input("Paste code") == ""
 
 
+@pytest.mark.asyncio
+async def test_multiline_input_reads_piped_stdin_at_once() -> None:
+    """Non-interactive stdin is consumed whole without starting a prompt session."""
+    with (
+        patch("determystic.cli.ui.sys.stdin", io.StringIO("def f():\n    pass\n\n")),
+        patch("determystic.cli.ui.PromptSession") as mock_session,
+    ):
+        assert await multiline_input("Paste code") == "def f():\n    pass"
+
+    mock_session.assert_not_called()
+
+
 # determystic: tested-exceptions[determystic.cli.ui.text_input: EOFError, KeyboardInterrupt]
 @pytest.mark.asyncio
 async def test_text_input_exits_quietly_on_interrupt() -> None:
@@ -148,3 +168,64 @@ async def test_render_agent_stream_without_final_event() -> None:
 
     with patch("determystic.cli.ui.console.print"):
         assert await render_agent_stream(fake_events()) is None
+
+
+@pytest.mark.asyncio
+async def test_render_agent_stream_coalesces_text_chunks() -> None:
+    """Token chunks are written in one batch and flushed before the next event."""
+    deps = AgentDependencies()
+
+    async def fake_events():
+        yield StreamEvent(event_type="text_chunk", content="Writing ", deps=deps)
+        yield StreamEvent(event_type="text_chunk", content="[the] ", deps=deps)
+        yield StreamEvent(event_type="text_chunk", content="validator", deps=deps)
+        yield StreamEvent(event_type="tool_call_start", content="write_file", deps=deps)
+
+    output = io.StringIO()
+    with patch("determystic.cli.ui.console", Console(file=output, theme=THEME)):
+        await render_agent_stream(fake_events())
+
+    assert output.getvalue() == "Writing [the] validator  → write_file\n"
+
+
+@pytest.mark.asyncio
+async def test_render_agent_stream_flushes_partial_lines_after_a_delay() -> None:
+    """Buffered text without a newline is written once the flush timer fires."""
+    deps = AgentDependencies()
+    output = io.StringIO()
+    seen_before_next_event: list[str] = []
+
+    async def fake_events():
+        yield StreamEvent(event_type="text_chunk", content="Thinking", deps=deps)
+        await asyncio.sleep(0.1)
+        seen_before_next_event.append(output.getvalue())
+        yield StreamEvent(event_type="final_result", content="done", deps=deps)
+
+    with patch("determystic.cli.ui.console", Console(file=output, theme=THEME)):
+        await render_agent_stream(fake_events())
+
+    assert seen_before_next_event == ["Thinking"]
+
+
+def test_code_block_renders_plain_text_when_not_a_terminal() -> None:
+    """Redirected output skips syntax highlighting but keeps line numbers."""
+    output = io.StringIO()
+    with (
+        patch("determystic.cli.ui.console", Console(file=output, theme=THEME, width=60)),
+        patch("determystic.cli.ui.Syntax") as mock_syntax,
+    ):
+        code_block("x = 1\ny = [2]", title="snippet", line_numbers=True)
+
+    mock_syntax.assert_not_called()
+    assert "1 x = 1" in output.getvalue()
+    assert "2 y = [2]" in output.getvalue()
+
+
+def test_code_preview_truncates_long_code() -> None:
+    """Previews show the first lines and an ellipsis only when code was cut."""
+    with patch("determystic.cli.ui.code_block") as mock_code_block:
+        code_preview("\n".join(f"line {i}" for i in range(12)), title="long", max_lines=3)
+        code_preview("a\nb\nc", title="short", max_lines=3)
+
+    assert mock_code_block.call_args_list[0].args[0] == "line 0\nline 1\nline 2\n..."
+    assert mock_code_block.call_args_list[1].args[0] == "a\nb\nc"
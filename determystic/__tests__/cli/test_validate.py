@@ -1,8 +1,11 @@
 """Tests for the validate CLI orchestration helpers."""
 
+import subprocess
+import sys
 from types import SimpleNamespace
 from typing import cast
 
+import pytest
 from rich.console import Console
 
 import determystic.cli.validate as validate_module
@@ -11,7 +14,9 @@ from determystic.cli.validate import (
     ValidationJob,
     _create_status_table,
     _create_validation_jobs,
+    _launch_order,
     _print_detailed_results,
+    _run_quietly,
     _target_label,
 )
 from determystic.project_discovery import ValidationTarget
@@ -106,6 +111,112 @@ def test_status_rendering_uses_separate_tables_for_each_scope() -> None:
     assert "│ Scope " not in output
 
 
+def test_status_table_uses_precomputed_failure_summaries() -> None:
+    """Failed rows render the cached summary instead of re-reading the output."""
+    validator = cast(
+        BaseValidator,
+        SimpleNamespace(name="static_analysis", display_name="Static Analysis"),
+    )
+    jobs = [ValidationJob(key="root:static", validator=validator, target_label=".")]
+    results = {
+        "root:static": ValidationResult(success=False, output="first issue\nsecond issue"),
+    }
+    console = Console(record=True, width=120, color_system=None, theme=THEME)
+
+    console.print(
+        _create_status_table(
+            jobs,
+            results,
+            include_scope=False,
+            summaries={"root:static": "cached summary"},
+        )
+    )
+    output = console.export_text()
+
+    assert "cached summary" in output
+    assert "first issue" not in output
+
+
+def test_launch_order_starts_subprocess_validators_first() -> None:
+    """Subprocess-backed validators are launched ahead of in-process ones, keeping relative order."""
+
+    def job(key: str, launches_subprocess: bool) -> ValidationJob:
+        validator = cast(
+            BaseValidator,
+            SimpleNamespace(name=key, launches_subprocess=launches_subprocess),
+        )
+        return ValidationJob(key=key, validator=validator, target_label=".")
+
+    jobs = [
+        job("custom", False),
+        job("ruff", True),
+        job("hanging", False),
+        job("ty", True),
+    ]
+
+    assert [job.key for job in _launch_order(jobs)] == ["ruff", "ty", "custom", "hanging"]
+
+
+@pytest.mark.asyncio
+async def test_run_quietly_prints_plain_pass_fail_lines(capsys) -> None:
+    """Quiet mode prints one line per check and sends failure output to stderr."""
+
+    def job(key: str, result: ValidationResult) -> ValidationJob:
+        async def validate() -> ValidationResult:
+            return result
+
+        validator = cast(
+            BaseValidator,
+            SimpleNamespace(
+                display_name=key.title(),
+                launches_subprocess=False,
+                validate=validate,
+            ),
+        )
+        return ValidationJob(key=key, validator=validator, target_label=".")
+
+    jobs = [
+        job("ruff", ValidationResult(success=True, output="All checks passed")),
+        job("custom", ValidationResult(success=False, output="app.py:3: [bold]x[/bold]\n")),
+    ]
+
+    assert await _run_quietly(jobs, include_scope=False) is False
+
+    captured = capsys.readouterr()
+    assert captured.out == "PASS Ruff\nFAIL Custom\n"
+    assert captured.err == "app.py:3: [bold]x[/bold]\n"
+
+
+# determystic: tested-exceptions[determystic.cli.validate._validate_job: Exception]
+@pytest.mark.asyncio
+async def test_run_quietly_reports_crashing_validators_as_failures(capsys) -> None:
+    """A validator that raises fails its own check while the others still run."""
+
+    async def crash() -> ValidationResult:
+        raise RuntimeError("boom")
+
+    async def passing() -> ValidationResult:
+        return ValidationResult(success=True, output="")
+
+    jobs = [
+        ValidationJob(
+            key=name,
+            validator=cast(
+                BaseValidator,
+                SimpleNamespace(display_name=name, launches_subprocess=False, validate=validate),
+            ),
+            target_label=".",
+        )
+        for name, validate in [("Broken", crash), ("Fine", passing)]
+    ]
+
+    assert await _run_quietly(jobs, include_scope=False) is False
+
+    captured = capsys.readouterr()
+    assert captured.out == "FAIL Broken\nPASS Fine\n"
+    assert "Unexpected error running validator: RuntimeError: boom" in captured.err
+
+
 def test_detailed_results_are_grouped_by_scope(monkeypatch) -> None:
     """Detailed failures use scope sections instead of repeated prefixed headings."""
     validator = cast(
@@ -149,6 +260,29 @@ def test_detailed_results_are_grouped_by_scope(monkeypatch) -> None:
     assert "standalone-tool / Static Analysis" not in output
 
 
+def test_detailed_results_print_output_literally(monkeypatch) -> None:
+    """Validator output containing brackets is not interpreted as Rich markup."""
+    validator = cast(
+        BaseValidator,
+        SimpleNamespace(name="custom", display_name="Custom"),
+    )
+    jobs = [ValidationJob(key="root:custom", validator=validator, target_label=".")]
+    results = {
+        "root:custom": ValidationResult(
+            success=False,
+            output="app.py:3: [bold]Optional[str][/bold] found\napp.py:7: second",
+        ),
+    }
+    console = Console(record=True, width=120, color_system=None, theme=THEME)
+    monkeypatch.setattr(validate_module, "console", console)
+
+    _print_detailed_results(jobs, results, verbose=False, include_scope=False)
+    output = console.export_text()
+
+    assert "  app.py:3: [bold]Optional[str][/bold] found" in output
+    assert "  app.py:7: second" in output
+
+
 # determystic: tested-exceptions[determystic.cli.validate._target_label: ValueError]
 def test_target_label_uses_absolute_path_for_targets_outside_requested_path(tmp_path) -> None:
     """Target labels fall back to absolute paths for unrelated roots."""
@@ -162,3 +296,19 @@ def test_target_label_uses_absolute_path_for_targets_outside_requested_path(tmp_
     )
 
     assert _target_label(target, requested_root) == str(outside_root.resolve())
+
+
+def test_validate_command_does_not_import_agent_stack() -> None:
+    """Loading the validate command leaves pydantic-ai unimported."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, determystic.cli.validate; print('pydantic_ai' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "False"
@@ -1,6 +1,10 @@
 """Tests for the external validator interface."""
 
-from determystic.external import DeterministicTraverser
+import ast
+import sys
+from unittest.mock import patch
+
+from determystic.external import DeterministicTraverser, jit
 
 
 # determystic: tested-exceptions[determystic.external.DeterministicTraverser.validate: SyntaxError]
@@ -14,3 +18,114 @@ def test_deterministic_traverser_validate_reports_syntax_errors() -> None:
     assert result.issues is not None
     assert len(result.issues) == 1
     assert "Syntax error" in result.issues[0].message
+
+
+def test_deterministic_traverser_dispatches_visit_methods() -> None:
+    """visit_* methods run for matching nodes and traversal reaches nested nodes."""
+
+    class NameTraverser(DeterministicTraverser):
+        def visit_Name(self, node):
+            self.add_error(node, f"name {node.id}")
+            self.generic_visit(node)
+
+    result = NameTraverser("def f():\n    return value + other\n").validate()
+
+    assert result.issues is not None
+    assert [issue.message for issue in result.issues] == ["name value", "name other"]
+    assert NameTraverser._visitor_table[ast.Name] == "visit_Name"
+
+
+def test_overridden_visit_sees_every_node() -> None:
+    """Traversers that override visit still receive each child node through it."""
+    seen: list[str] = []
+
+    class RecordingTraverser(DeterministicTraverser):
+        def visit(self, node):
+            seen.append(type(node).__name__)
+            return super().visit(node)
+
+    RecordingTraverser("x = f(1)\n").validate()
+
+    assert seen[:3] == ["Module", "Assign", "Name"]
+    assert "Call" in seen
+    assert "Constant" in seen
+
+
+def test_statements_only_traverser_skips_expression_subtrees() -> None:
+    """statements_only traversers still reach nested statements but never expressions."""
+    visited: list[str] = []
+
+    class StatementTraverser(DeterministicTraverser):
+        statements_only = True
+
+        def visit_FunctionDef(self, node):
+            visited.append(node.name)
+            self.generic_visit(node)
+
+        def visit_Name(self, node):
+            visited.append(node.id)
+
+    code = "class A:\n    def method(self):\n        return value\n"
+    result = StatementTraverser(code).validate()
+
+    assert result.is_valid
+    assert visited == ["method"]
+
+
+def test_statement_level_visitors_infer_expression_skipping() -> None:
+    """Traversers that only visit statement-level nodes skip expressions automatically."""
+
+    class TryTraverser(DeterministicTraverser):
+        def visit_Try(self, node):
+            self.generic_visit(node)
+
+    class CallTraverser(DeterministicTraverser):
+        def visit_FunctionDef(self, node):
+            self.generic_visit(node)
+
+        def visit_Call(self, node):
+            self.generic_visit(node)
+
+    assert TryTraverser._skip_expressions is True
+    assert CallTraverser._skip_expressions is False
+
+
+def test_generic_visit_override_keeps_expression_subtrees() -> None:
+    """Traversers that override generic_visit still reach every expression."""
+
+    class BadNameTraverser(DeterministicTraverser):
+        def generic_visit(self, node):
+            if isinstance(node, ast.Name) and node.id == "bad":
+                self.add_error(node, "bad name")
+            super().generic_visit(node)
+
+    class EmptyTraverser(DeterministicTraverser):
+        pass
+
+    result = BadNameTraverser("x = bad\n").validate()
+
+    assert result.issues is not None
+    assert [issue.message for issue in result.issues] == ["bad name"]
+    assert BadNameTraverser._skip_expressions is False
+    assert EmptyTraverser._skip_expressions is False
+
+
+def test_walk_of_types_yields_matching_nodes_in_source_order() -> None:
+    """The iterative walker finds nested matches in the order they appear."""
+    code = "def a():\n    try:\n        pass\n    except E:\n        pass\n\ntry:\n    pass\nfinally:\n    pass\n"
+    traverser = DeterministicTraverser(code)
+
+    tries = list(traverser.walk_of_types(ast.parse(code), (ast.Try,)))
+
+    assert [node.lineno for node in tries] == [2, 7]
+
+
+# determystic: tested-exceptions[determystic.external.jit: ImportError]
+def test_jit_returns_function_unchanged_without_numba() -> None:
+    """The optional jit decorator is a no-op when Numba isn't installed."""
+
+    def total(values):
+        return sum(values)
+
+    with patch.dict(sys.modules, {"numba": None}):
+        assert jit(total) is total
@@ -1,5 +1,6 @@
 """Tests for IO utilities."""
 
+import asyncio
 import subprocess
 import sys
 import types
@@ -7,7 +8,12 @@ from unittest.mock import patch
 
 import pytest
 
-from determystic.io import detect_git_root, get_determystic_package_path
+from determystic.io import (
+    async_to_sync,
+    detect_git_root,
+    get_determystic_package_path,
+    run_async,
+)
 
 
 # determystic: tested-exceptions[determystic.io.detect_git_root: CalledProcessError, FileNotFoundError]
@@ -37,3 +43,48 @@ def test_get_determystic_package_path_reports_resolution_errors() -> None:
     with patch.dict(sys.modules, {"determystic": fake_module}):
         with pytest.raises(RuntimeError, match="Unable to resolve"):
             get_determystic_package_path()
+
+
+# determystic: tested-exceptions[determystic.io._new_event_loop: ImportError]
+def test_async_to_sync_falls_back_without_uvloop() -> None:
+    """Async entrypoints still run on the stock loop when uvloop is missing."""
+
+    @async_to_sync
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    with patch.dict(sys.modules, {"uvloop": None}):
+        assert add(1, 2) == 3
+
+
+@pytest.mark.parametrize(
+    "version_info",
+    [
+        (3, 10, 0),
+        pytest.param(
+            (3, 11, 0),
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 11), reason="asyncio.Runner requires Python 3.11"
+            ),
+        ),
+    ],
+)
+def test_run_async_cancels_leftover_tasks(version_info) -> None:
+    """Background tasks still pending when the coroutine returns are cancelled."""
+    cancelled = []
+
+    async def background() -> None:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def main() -> str:
+        asyncio.get_running_loop().create_task(background())
+        await asyncio.sleep(0)
+        return "done"
+
+    with patch("determystic.io.sys", types.SimpleNamespace(version_info=version_info)):
+        assert run_async(main()) == "done"
+    assert cancelled == [True]
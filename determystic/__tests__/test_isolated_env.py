@@ -4,7 +4,7 @@ import os
 import subprocess
 from unittest.mock import patch
 
-from determystic.isolated_env import IsolatedEnv
+from determystic.isolated_env import MAX_OUTPUT_CHARS, IsolatedEnv
 
 
 # determystic: tested-exceptions[determystic.isolated_env.IsolatedEnv.run_tests: TimeoutExpired]
@@ -23,6 +23,7 @@ def test_run_tests_reports_timeouts(tmp_path) -> None:
 
     assert success is False
     assert output == "Test execution timed out"
+    assert env.last_run_completed is False
 
 
 # determystic: tested-exceptions[determystic.isolated_env.IsolatedEnv.run_tests: Exception]
@@ -79,6 +80,24 @@ def test_create_test_package_uses_import_path_when_no_project_root(tmp_path) ->
     assert not (package_dir / "determystic").exists()
 
 
+def test_create_test_package_skips_rewriting_unchanged_files(tmp_path) -> None:
+    """Re-running with one file edited should only rewrite that file."""
+    env = IsolatedEnv()
+    env.temp_dir = tmp_path
+
+    package_dir = env._create_test_package("validator", "tests")
+    validator_path = package_dir / "validator.py"
+    test_path = package_dir / "test_validator.py"
+    os.utime(validator_path, ns=(0, 0))
+    os.utime(test_path, ns=(0, 0))
+
+    env._create_test_package("validator", "updated tests")
+
+    assert validator_path.stat().st_mtime_ns == 0
+    assert test_path.stat().st_mtime_ns != 0
+    assert test_path.read_text() == "updated tests"
+
+
 def test_run_tests_adds_installed_package_parent_to_pythonpath(tmp_path) -> None:
     """uvx-style runs should import determystic from the currently running package path."""
     site_packages = tmp_path / "site-packages"
@@ -101,4 +120,49 @@ def test_run_tests_adds_installed_package_parent_to_pythonpath(tmp_path) -> None
 
     assert success is True
     assert output == "tests passed"
+    assert env.last_run_completed is True
     assert pythonpath_entries[0] == str(site_packages.absolute())
+
+
+def test_run_tests_skips_uv_sync_after_first_successful_run(tmp_path) -> None:
+    """Only the first run in an environment should pay for uv's sync step."""
+    env = IsolatedEnv()
+    env.temp_dir = tmp_path
+
+    completed = subprocess.CompletedProcess(
+        args=["uv", "run", "pytest"],
+        returncode=1,
+        stdout="1 failed",
+        stderr="",
+    )
+
+    with patch("determystic.isolated_env.subprocess.run", return_value=completed) as mock_run:
+        env.run_tests("validator", "tests")
+        env.run_tests("validator", "updated tests")
+
+    first_command = mock_run.call_args_list[0].args[0]
+    second_command = mock_run.call_args_list[1].args[0]
+
+    assert "--no-sync" not in first_command
+    assert second_command[:3] == ["uv", "run", "--no-sync"]
+
+
+def test_run_tests_truncates_long_output_to_its_tail(tmp_path) -> None:
+    """Huge pytest logs are cut down to the summary at their end."""
+    env = IsolatedEnv()
+    env.temp_dir = tmp_path
+
+    completed = subprocess.CompletedProcess(
+        args=["uv", "run", "pytest"],
+        returncode=1,
+        stdout="x" * (MAX_OUTPUT_CHARS * 2) + "\n1 failed",
+        stderr="",
+    )
+
+    with patch("determystic.isolated_env.subprocess.run", return_value=completed):
+        success, output = env.run_tests("validator", "tests")
+
+    assert success is False
+    assert output.startswith("...[truncated]\n")
+    assert output.endswith("1 failed")
+    assert len(output) == MAX_OUTPUT_CHARS + len("...[truncated]\n")
@@ -1,12 +1,19 @@
 """Pydantic AI agent for creating and testing AST validators."""
 
+import asyncio
+import hashlib
+import inspect
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional, AsyncGenerator
 from pydantic_ai.messages import PartDeltaEvent, TextPartDelta
 from pydantic_ai.messages import FunctionToolCallEvent, FunctionToolResultEvent, RetryPromptPart
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_ai import Agent, RunContext
+from pydantic_ai.settings import ModelSettings
 
+from determystic import external
 from determystic.isolated_env import IsolatedEnv
 
 
@@ -27,8 +34,12 @@ The validator should:
 You MUST create a validator using the AST traverser pattern from `determystic.external`:
 
 ```python
+import ast
+
 from determystic.external import DeterministicTraverser
 
+_TARGET_NAMES = frozenset({"Optional"})
+
 class YourValidatorTraverser(DeterministicTraverser):
     '''Custom AST traverser for your specific validation.'''
     
@@ -47,16 +58,43 @@ class YourValidatorTraverser(DeterministicTraverser):
     
     def detect_problem(self, node):
         '''Your custom logic to detect the problematic pattern.'''
-        # Example: check if node contains "Optional["
-        try:
-            node_source = ast.unparse(node)
-            return "Optional[" in node_source
-        except:
-            return False
+        # Example: check if node is an `Optional[...]` subscript
+        return (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id in _TARGET_NAMES
+        )
 ```
 
 **The traverser will be automatically discovered and executed by the validation system.**
 
+### Traversal Performance
+
+`DeterministicTraverser` dispatches `visit_*` methods through a lookup table keyed by node type that is built once when your class is defined, and its `generic_visit` walks children with `ast.iter_child_nodes`. Do not override `visit` or `generic_visit`; define `visit_*` methods and call `self.generic_visit(node)` as shown above.
+
+If your validator only inspects statement nodes (imports, function definitions, class definitions, try blocks), traversal never descends into expression subtrees, which make up most of a typical AST. This is switched on automatically when every `visit_*` method targets a statement-level node, and you can force it by setting `statements_only = True` on the class:
+
+```python
+class TryInTestTraverser(DeterministicTraverser):
+    statements_only = True
+
+    def visit_FunctionDef(self, node):
+        ...
+        self.generic_visit(node)
+```
+
+For simple "find every X inside this node" checks, use `self.walk_of_types(node, (ast.Try,))` instead of a nested `ast.walk` or an extra `visit_*` recursion. It walks iteratively, yields matches in source order, and only returns nodes of the requested types:
+
+```python
+    def visit_FunctionDef(self, node):
+        if node.name.startswith("test"):
+            for try_node in self.walk_of_types(node, (ast.Try,)):
+                self.add_error(try_node, "Tests should not catch exceptions")
+        self.generic_visit(node)
+```
+
+If a helper does heavy pure-numeric work (scoring, offset arithmetic over many values), decorate it with `jit` from `determystic.external`. It compiles with Numba when available and is a no-op otherwise. Never apply it to methods that touch AST nodes.
+
 ## Examples of Pattern Detection
 
 ### Example 1: No exceptions in test functions
@@ -103,11 +141,33 @@ def process(value: Optional[str]) -> None:  # BAD: Use str | None
    - is_valid=True: Code is acceptable
    - Include error messages with line numbers and context
 
-4. **Test thoroughly:**
+4. **Match structurally, not textually:**
+   - Never call `ast.unparse` inside a `visit_*` method on every node. It re-stringifies the whole subtree on each visit, which is quadratic over the tree
+   - Match on node fields instead, and keep the names you look for in a module-level `frozenset`
+   - If textual matching is unavoidable, precompile the pattern once at module level with `_PAT = re.compile(...)`
+
+   ```python
+   # BAD: stringifies every subtree while walking it
+   def visit_Subscript(self, node):
+       if "Optional[" in ast.unparse(node):
+           self.add_error(node, "Use T | None instead of Optional[T]")
+       self.generic_visit(node)
+
+   # GOOD: checks the node fields directly
+   _TARGET_NAMES = frozenset({"Optional"})
+
+   def visit_Subscript(self, node):
+       if isinstance(node.value, ast.Name) and node.value.id in _TARGET_NAMES:
+           self.add_error(node, "Use T | None instead of Optional[T]")
+       self.generic_visit(node)
+   ```
+
+5. **Test thoroughly:**
    - The exact user-provided code should be detected as problematic
    - Create additional test cases that should be flagged
    - Create valid examples that should NOT be flagged
    - Test edge cases
+   - Parse each snippet once at module level (`BAD_TREE = ast.parse(BAD_CODE)`) and pass the tree to `YourValidatorTraverser(BAD_CODE).validate(BAD_TREE)`. `validate` skips its own parse when given a tree, so tests that check the same snippet several times don't re-parse it
 
 ## Code Extraction Guidelines
 
@@ -139,9 +199,11 @@ def simple_example():
 - Use `write_file` to write files with specific filenames:
  - Use filename "validator.py" for the AST validator implementation
  - Use filename "test_validator.py" for the test cases
+- Use `write_files` to write both files in a single call when you produce them together
 - Use `read_file` to read the contents of any file
 - Use `edit_file` to edit specific parts of a file
 - Use `run_tests` to execute tests and verify they work correctly
+- Use `write_and_test` for your first attempt: it writes both "validator.py" and "test_validator.py" and runs the tests in a single call. Use the granular tools above for later revisions
 - Use `finalize` when the implementation is complete and all tests pass
 
 ## Key Reminders
@@ -152,6 +214,8 @@ def simple_example():
 - Make the error messages clear and actionable
 """
 
+DEFAULT_REQUIREMENTS = "Detect issues in the provided code"
+
 TASK_PROMPT_TEMPLATE = """Create a comprehensive AST validator and test suite.
 
 User-provided code that SHOULD BE DETECTED as problematic:
@@ -180,10 +244,25 @@ Please:
 Remember: Focus on minimal viable reproduction cases for both good and bad behavior within the AST parsing and testing framework.
 """
 
+# Split the task template once at import so each prompt is a single join
+_TASK_PROMPT_PREFIX, _TASK_PROMPT_TAIL = TASK_PROMPT_TEMPLATE.split("{user_code}")
+_TASK_PROMPT_MIDDLE, _TASK_PROMPT_SUFFIX = _TASK_PROMPT_TAIL.split("{requirements}")
+
+# Files the agent may write
+ALLOWED_FILES = frozenset({"validator.py", "test_validator.py"})
+
+# Number of distinct (validator, tests) results remembered per agent run
+TEST_RESULT_CACHE_SIZE = 32
+
 # Dependencies
 class AgentDependencies(BaseModel):
     """Dependencies and state for the agent."""
     files: dict[str, str] = Field(default_factory=dict, description="Map of filenames to their contents")
+    _env: IsolatedEnv | None = PrivateAttr(default=None)
+    _test_results: OrderedDict[str, tuple[bool, str]] = PrivateAttr(default_factory=OrderedDict)
+    # pydantic-ai runs the tool calls of one response concurrently, so use of
+    # the shared environment is serialized per run
+    _env_lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
     
     # Legacy support - these now proxy to the files dict
     @property
@@ -206,12 +285,45 @@ class AgentDependencies(BaseModel):
         """Legacy setter for validation contents."""
         self.files["validator.py"] = value
 
+    def get_env(self) -> IsolatedEnv:
+        """Return this run's isolated environment, entering it on first use.
+
+        The agent usually runs the tests several times while iterating, so one
+        environment is kept for the whole run instead of one per test run.
+        """
+        if self._env is None:
+            self._env = IsolatedEnv().__enter__()
+        return self._env
+
+    async def aclose_env(self) -> None:
+        """Tear down this run's isolated environment if one was created.
+
+        Removing the temp directory walks the uv virtualenv inside it, so the
+        deletion runs in a worker thread to let concurrent runs keep going.
+        """
+        async with self._env_lock:
+            if self._env is None:
+                return
+            env, self._env = self._env, None
+            await asyncio.to_thread(env.__exit__, None, None, None)
+
 
 # Models
-class StreamEvent(BaseModel):
-    """Event emitted during streaming execution."""
-    event_type: str = Field(description="Type of event (user_prompt, model_request_start, text_chunk, tool_call_start, tool_call_end, final_result)")
-    content: str = Field(description="Content of the event")
+@dataclass(slots=True)
+class StreamEvent:
+    """Event emitted during streaming execution.
+
+    One event is built per streamed text delta, so this is a plain slotted
+    dataclass rather than a validated model.
+
+    Attributes:
+        event_type: Type of event (user_prompt, model_request_start, text_chunk,
+            tool_processing_start, tool_call_start, tool_call_end, final_result)
+        content: Content of the event
+        deps: Agent state at the time the event was emitted
+    """
+    event_type: str
+    content: str
     deps: AgentDependencies
 
 
@@ -221,6 +333,11 @@ class WriteFileInput(BaseModel):
     content: str = Field(description="The file content")
 
 
+class WriteFilesInput(BaseModel):
+    """Input for writing several files in one call."""
+    files: list[WriteFileInput] = Field(description="The files to write")
+
+
 class ReadFileInput(BaseModel):
     """Input for reading a file."""
     filename: str = Field(description="The name of the file to read")
@@ -239,6 +356,12 @@ class RunTestsInput(BaseModel):
     message: str = Field(default="Running tests", description="Optional message about test execution")
 
 
+class WriteAndTestInput(BaseModel):
+    """Input for writing both files and running the tests in one step."""
+    validator: str = Field(description="The full contents of validator.py")
+    tests: str = Field(description="The full contents of test_validator.py")
+
+
 class FinalizeInput(BaseModel):
     """Input for finalizing the implementation."""
     message: str = Field(description="Summary of what was accomplished")
@@ -252,9 +375,14 @@ class ReadExternalFileInput(BaseModel):
 
 
 # Agent
+# Deterministic sampling keeps validator generation reproducible. The token
+# cap leaves room for a write_and_test call that carries both full files.
+MODEL_SETTINGS = ModelSettings(temperature=0.0, max_tokens=8192)
+
 agent = Agent(
     deps_type=AgentDependencies,
     system_prompt=SYSTEM_PROMPT,
+    model_settings=MODEL_SETTINGS,
 )
 
 
@@ -271,17 +399,18 @@ async def run_tests(
     if not ctx.deps.test_contents:
         return "❌ No test code available. Please write tests first."
     
-    # Use isolated environment to run tests
-    with IsolatedEnv() as env:
-        success, output = env.run_tests(
-            validator_code=ctx.deps.validation_contents,
-            test_code=ctx.deps.test_contents
-        )
-        
-        if success:
-            return f"✅ Tests passed!\n\n{output}"
-        else:
-            return f"❌ Tests failed:\n\n{output}"
+    return await _run_isolated_tests(ctx.deps)
+
+
+@agent.tool
+async def write_and_test(
+    ctx: RunContext[AgentDependencies],
+    input: WriteAndTestInput
+) -> str:
+    """Write validator.py and test_validator.py, then run the tests."""
+    ctx.deps.validation_contents = input.validator
+    ctx.deps.test_contents = input.tests
+    return await _run_isolated_tests(ctx.deps)
 
 
 @agent.tool
@@ -290,12 +419,16 @@ async def write_file(
     input: WriteFileInput
 ) -> str:
     """Write content to a file with the specified filename."""
-    # Validate filename and set appropriate content
-    if input.filename in ["validator.py", "test_validator.py"]:
-        ctx.deps.files[input.filename] = input.content
-        return f"✅ File '{input.filename}' written ({len(input.content)} characters)"
-    else:
-        return f"❌ Invalid filename '{input.filename}'. Expected 'validator.py' or 'test_validator.py'"
+    return _write_one(ctx.deps, input)
+
+
+@agent.tool
+async def write_files(
+    ctx: RunContext[AgentDependencies],
+    input: WriteFilesInput
+) -> str:
+    """Write several files at once, reporting the result for each."""
+    return "\n".join(_write_one(ctx.deps, file) for file in input.files)
 
 
 @agent.tool
@@ -322,20 +455,22 @@ async def edit_file(
     
     content = ctx.deps.files[input.filename]
     
-    # Count occurrences of old_str
-    count = content.count(input.old_str)
+    # Locate the first occurrence once; the rest of the file is only scanned
+    # again to rule out ambiguous matches
+    index = content.find(input.old_str)
     
-    if count == 0:
+    if index == -1:
         return f"❌ String not found in '{input.filename}': '{input.old_str[:50]}...'"
-    elif count > 1 and not input.target_all:
-        return f"❌ Multiple occurrences ({count}) found in '{input.filename}'. Use target_all=True to replace all, or provide a more specific old_str."
     
     # Perform replacement
     if input.target_all:
+        replacements = content.count(input.old_str)
         new_content = content.replace(input.old_str, input.new_str)
-        replacements = count
+    elif content.find(input.old_str, index + max(len(input.old_str), 1)) != -1:
+        count = content.count(input.old_str)
+        return f"❌ Multiple occurrences ({count}) found in '{input.filename}'. Use target_all=True to replace all, or provide a more specific old_str."
     else:
-        new_content = content.replace(input.old_str, input.new_str, 1)
+        new_content = content[:index] + input.new_str + content[index + len(input.old_str):]
         replacements = 1
     
     ctx.deps.files[input.filename] = new_content
@@ -350,12 +485,8 @@ async def read_external_file(
 ) -> str:
     """Read the current external.py file to understand available classes and functions."""
     try:
-        # Read the external.py file from the determystic package
-        import determystic.external
-        import inspect
-        
-        # Get the path to the external.py file
-        external_file_path = inspect.getfile(determystic.external)
+        # Get the path to the external.py file in the determystic package
+        external_file_path = inspect.getfile(external)
         
         # Read the file content
         with open(external_file_path, 'r', encoding='utf-8') as f:
@@ -393,96 +524,97 @@ async def stream_create_validator(  # determystic: used
     deps = AgentDependencies()
     
     # Format the prompt
-    prompt = TASK_PROMPT_TEMPLATE.format(
-        user_code=user_code,
-        requirements=requirements or "Detect issues in the provided code"
-    )
+    prompt = _build_task_prompt(user_code, requirements)
     
-    # Use agent.iter() for streaming with graph introspection
-    async with agent.iter(prompt, model=anthropic_client, deps=deps) as agent_run:
-        async for node in agent_run:
-            if agent.is_user_prompt_node(node):
-                # User prompt started
-                event = StreamEvent(
-                    event_type='user_prompt',
-                    content=f"Processing user request: {node.user_prompt}",
-                    deps=deps
-                )
-                yield event
+    try:
+        # Use agent.iter() for streaming with graph introspection
+        async with agent.iter(prompt, model=anthropic_client, deps=deps) as agent_run:
+            async for node in agent_run:
+                if agent.is_user_prompt_node(node):
+                    # User prompt started
+                    event = StreamEvent(
+                        event_type='user_prompt',
+                        content=f"Processing user request: {node.user_prompt}",
+                        deps=deps
+                    )
+                    yield event
                 
-            elif agent.is_model_request_node(node):
-                # Model request - stream the text response
-                event = StreamEvent(
-                    event_type='model_request_start',
-                    content="🤖 Agent is thinking...",
-                    deps=deps
-                )
-                yield event
+                elif agent.is_model_request_node(node):
+                    # Model request - stream the text response
+                    event = StreamEvent(
+                        event_type='model_request_start',
+                        content="🤖 Agent is thinking...",
+                        deps=deps
+                    )
+                    yield event
                 
-                # Stream the model response text
-                async with node.stream(agent_run.ctx) as request_stream:
-                    async for stream_event in request_stream:
-                        if isinstance(stream_event, PartDeltaEvent):
-                            if isinstance(stream_event.delta, TextPartDelta):
-                                if stream_event.delta.content_delta:
-                                    event = StreamEvent(
-                                        event_type='text_chunk',
-                                        content=stream_event.delta.content_delta,
-                                        deps=deps
-                                    )
-                                    yield event
+                    # Stream the model response text
+                    async with node.stream(agent_run.ctx) as request_stream:
+                        async for stream_event in request_stream:
+                            if (
+                                isinstance(stream_event, PartDeltaEvent)
+                                and isinstance(stream_event.delta, TextPartDelta)
+                                and stream_event.delta.content_delta
+                            ):
+                                event = StreamEvent(
+                                    event_type='text_chunk',
+                                    content=stream_event.delta.content_delta,
+                                    deps=deps
+                                )
+                                yield event
                                 
-            elif agent.is_call_tools_node(node):
-                # Tool calls - show what tools are being called
-                event = StreamEvent(
-                    event_type='tool_processing_start',
-                    content="🔧 Using tools to create and test files...",
-                    deps=deps
-                )
-                yield event
+                elif agent.is_call_tools_node(node):
+                    # Tool calls - show what tools are being called
+                    event = StreamEvent(
+                        event_type='tool_processing_start',
+                        content="🔧 Using tools to create and test files...",
+                        deps=deps
+                    )
+                    yield event
                 
-                # Stream tool calls and results
-                async with node.stream(agent_run.ctx) as tool_stream:
-                    async for stream_event in tool_stream:
-                        if isinstance(stream_event, FunctionToolCallEvent):
-                            # Tool call started
-                            tool_name = stream_event.part.tool_name                            
-                            event = StreamEvent(
-                                event_type='tool_call_start',
-                                content=f"🔧 Starting {tool_name}",
-                                deps=deps
-                            )
-                            yield event
+                    # Stream tool calls and results
+                    async with node.stream(agent_run.ctx) as tool_stream:
+                        async for stream_event in tool_stream:
+                            if isinstance(stream_event, FunctionToolCallEvent):
+                                # Tool call started
+                                tool_name = stream_event.part.tool_name                            
+                                event = StreamEvent(
+                                    event_type='tool_call_start',
+                                    content=f"🔧 Starting {tool_name}",
+                                    deps=deps
+                                )
+                                yield event
                             
-                        elif isinstance(stream_event, FunctionToolResultEvent):
-                            # Tool call completed
-                            is_failure = isinstance(stream_event.result, RetryPromptPart)
+                            elif isinstance(stream_event, FunctionToolResultEvent):
+                                # Tool call completed
+                                is_failure = isinstance(stream_event.result, RetryPromptPart)
                             
-                            if is_failure:
-                                # Show full output for failures (RetryPromptPart means tool failed)
-                                display_content = f"❌ Tool failed: {stream_event.result.content}"
-                            else:
-                                # Truncate successful output for readability
-                                result_content = stream_event.result.content
-                                display_content = f"✅ Tool completed: {result_content[:100]}..." if len(result_content) > 100 else f"✅ Tool completed: {result_content}"
+                                if is_failure:
+                                    # Show full output for failures (RetryPromptPart means tool failed)
+                                    display_content = f"❌ Tool failed: {stream_event.result.content}"
+                                else:
+                                    # Truncate successful output for readability
+                                    result_content = stream_event.result.content
+                                    display_content = f"✅ Tool completed: {result_content[:100]}..." if len(result_content) > 100 else f"✅ Tool completed: {result_content}"
                             
-                            event = StreamEvent(
-                                event_type='tool_call_end',
-                                content=display_content,
-                                deps=deps
-                            )
-                            yield event
+                                event = StreamEvent(
+                                    event_type='tool_call_end',
+                                    content=display_content,
+                                    deps=deps
+                                )
+                                yield event
                             
-            elif agent.is_end_node(node):
-                # Final result - include file contents
-                event = StreamEvent(
-                    event_type='final_result',
-                    content=f"✅ Complete! {node.data.output}",
-                    deps=deps
-                )
-                yield event
-                break
-
+                elif agent.is_end_node(node):
+                    # Final result - include file contents
+                    event = StreamEvent(
+                        event_type='final_result',
+                        content=f"✅ Complete! {node.data.output}",
+                        deps=deps
+                    )
+                    yield event
+                    break
+    finally:
+        await deps.aclose_env()
 
 # Non-streaming function
 async def create_ast_validator(  # determystic: used
@@ -500,13 +632,111 @@ async def create_ast_validator(  # determystic: used
     Returns:
         Tuple of (summary, validation_contents, test_contents)
     """
+    return await _run_validator_agent(user_code, requirements, anthropic_client)
+
+
+# Batch function
+async def create_ast_validators_batch(  # determystic: used
+    items: list[tuple[str, Optional[str]]],
+    anthropic_client,
+    concurrency: int = 32,
+) -> list[tuple[str, str, str]]:
+    """Create several AST validators concurrently with the shared agent.
+
+    Each item runs with its own AgentDependencies and isolated test
+    environment, so runs never share files.
+
+    Args:
+        items: Pairs of (user_code, requirements), one per validator
+        anthropic_client: Configured Anthropic client instance
+        concurrency: Maximum number of agent runs in flight at once
+
+    Returns:
+        One (summary, validation_contents, test_contents) tuple per item, in input order
+    """
+    if concurrency < 1:
+        # A zero-slot semaphore would leave every run waiting forever
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(user_code: str, requirements: Optional[str]) -> tuple[str, str, str]:
+        async with semaphore:
+            return await _run_validator_agent(user_code, requirements, anthropic_client)
+
+    return await asyncio.gather(
+        *(run_one(user_code, requirements) for user_code, requirements in items)
+    )
+
+
+async def _run_validator_agent(
+    user_code: str,
+    requirements: Optional[str],
+    anthropic_client,
+) -> tuple[str, str, str]:
+    """Run the agent once with fresh dependencies and return its generated files."""
     deps = AgentDependencies()
     
     # Format the prompt
-    prompt = TASK_PROMPT_TEMPLATE.format(
-        user_code=user_code,
-        requirements=requirements or "Detect issues in the provided code"
-    )
+    prompt = _build_task_prompt(user_code, requirements)
     
-    result = await agent.run(prompt, model=anthropic_client, deps=deps)
+    try:
+        result = await agent.run(prompt, model=anthropic_client, deps=deps)
+    finally:
+        await deps.aclose_env()
     return result.output, deps.validation_contents, deps.test_contents
+
+
+def _build_task_prompt(user_code: str, requirements: Optional[str]) -> str:
+    """Fill the task prompt template from its pre-split literal segments."""
+    requirements = requirements or DEFAULT_REQUIREMENTS
+    return f"{_TASK_PROMPT_PREFIX}{user_code}{_TASK_PROMPT_MIDDLE}{requirements}{_TASK_PROMPT_SUFFIX}"
+
+
+def _write_one(deps: AgentDependencies, file: WriteFileInput) -> str:
+    """Store one file in the agent state if its filename is allowed."""
+    # Validate filename and set appropriate content
+    if file.filename in ALLOWED_FILES:
+        if deps.files.get(file.filename) == file.content:
+            return f"✅ File '{file.filename}' unchanged ({len(file.content)} characters)"
+        deps.files[file.filename] = file.content
+        return f"✅ File '{file.filename}' written ({len(file.content)} characters)"
+    else:
+        return f"❌ Invalid filename '{file.filename}'. Expected 'validator.py' or 'test_validator.py'"
+
+
+async def _run_isolated_tests(deps: AgentDependencies) -> str:
+    """Run the current files in the run's isolated environment and format the outcome."""
+    # Reuse the run's isolated environment across test runs. The pytest
+    # subprocess blocks, so it runs in a worker thread to keep the event loop
+    # free for other agent runs and stream events.
+    # Identical file contents give identical results, so retries without an
+    # effective change are answered from the run's LRU cache.
+    async with deps._env_lock:
+        # Snapshot under the lock so the key matches the files actually tested
+        validator_code = deps.validation_contents
+        test_code = deps.test_contents
+        key = hashlib.sha256(f"{validator_code}\0{test_code}".encode()).hexdigest()
+        cached = deps._test_results.get(key)
+        if cached is not None:
+            deps._test_results.move_to_end(key)
+            success, output = cached
+            marker = " (cached)"
+        else:
+            env = deps.get_env()
+            success, output = await asyncio.to_thread(
+                env.run_tests,
+                validator_code=validator_code,
+                test_code=test_code
+            )
+            # Timeouts and setup errors (e.g. a slow first uv sync) are
+            # transient, so only verdicts from pytest itself are cached
+            if env.last_run_completed:
+                deps._test_results[key] = (success, output)
+                if len(deps._test_results) > TEST_RESULT_CACHE_SIZE:
+                    deps._test_results.popitem(last=False)
+            marker = ""
+    
+    if success:
+        return f"✅ Tests passed!{marker}\n\n{output}"
+    else:
+        return f"❌ Tests failed:{marker}\n\n{output}"
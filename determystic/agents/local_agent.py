@@ -13,6 +13,7 @@ from pydantic import BaseModel, Field
 
 from determystic.agents.create_validator import (
     AgentDependencies,
+    DEFAULT_REQUIREMENTS,
     StreamEvent,
     SYSTEM_PROMPT,
 )
@@ -264,7 +265,7 @@ def _external_interface() -> str:
 def _build_prompt(user_code: str, requirements: str | None, previous_failure: str | None = None) -> str:
     task_prompt = LOCAL_AGENT_TASK_PROMPT_TEMPLATE.format(
         user_code=user_code,
-        requirements=requirements or "Detect issues in the provided code",
+        requirements=requirements or DEFAULT_REQUIREMENTS,
     )
     local_instructions = LOCAL_AGENT_INSTRUCTIONS_TEMPLATE.format(
         external_interface=_external_interface(),
@@ -327,11 +328,8 @@ def _build_agent_command(agent_name: LocalAgentName, workdir: Path, output_path:
 
 
 def _read_generated_files(workdir: Path) -> tuple[str, str]:
-    validator_path = workdir / "validator.py"
-    tests_path = workdir / "test_validator.py"
-
-    validation_contents = validator_path.read_text() if validator_path.exists() else ""
-    test_contents = tests_path.read_text() if tests_path.exists() else ""
+    validation_contents = _read_optional_text(workdir / "validator.py")
+    test_contents = _read_optional_text(workdir / "test_validator.py")
 
     if not validation_contents or not test_contents:
         missing = []
@@ -344,6 +342,14 @@ def _read_generated_files(workdir: Path) -> tuple[str, str]:
     return validation_contents, test_contents
 
 
+def _read_optional_text(path: Path) -> str:
+    # Open directly rather than stat first; a missing file reads as empty
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return ""
+
+
 def _run_agent_once(
     agent_name: LocalAgentName,
     workdir: Path,
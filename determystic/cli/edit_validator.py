@@ -143,12 +143,7 @@ async def edit_validator_command(name: str | None, path: Path | None):
         console.print()
 
         # Show preview of the updated validator
-        lines = updated_validation.split("\n")[:10]
-        preview = "\n".join(lines)
-        if len(updated_validation.split("\n")) > 10:
-            preview += "\n..."
-
-        ui.code_block(preview, title=name)
+        ui.code_preview(updated_validation, title=name)
 
     except Exception as e:
         console.print(f"[error]Error saving validator files: {e}[/error]")
@@ -1,5 +1,6 @@
 """AST validator creation command."""
 
+import json
 import sys
 from pathlib import Path
 import re
@@ -18,6 +19,12 @@ from determystic.io import async_to_sync
 
 console = ui.console
 
+DEFAULT_ISSUE_DESCRIPTION = "Detect all potential issues"
+DEFAULT_VALIDATOR_NAME = "custom_validator"
+
+_INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+_REPEATED_HYPHENS = re.compile(r'-+')
+
 
 @click.command()
 @click.argument("path", type=click.Path(path_type=Path), required=False)
@@ -37,33 +44,41 @@ async def new_validator_command(path: Path | None):
         ui.error(str(e))
         sys.exit(1)
 
-    # Get code snippet from user
-    ui.section("Paste the problematic code", step="1/3")
-    code_snippet = await ui.multiline_input(
-        "Bad Python code your agent generated",
-        description="The validator will be built to flag this pattern.",
-    )
+    # Scripted runs pipe every field as one JSON object instead of answering prompts
+    scripted = not sys.stdin.isatty()
+    if scripted:
+        code_snippet, issue_description, raw_validator_name = _read_scripted_request()
+        if not code_snippet:
+            ui.error("No code provided.")
+            sys.exit(1)
+    else:
+        # Get code snippet from user
+        ui.section("Paste the problematic code", step="1/3")
+        code_snippet = await ui.multiline_input(
+            "Bad Python code your agent generated",
+            description="The validator will be built to flag this pattern.",
+        )
 
-    if not code_snippet:
-        ui.error("No code provided.")
-        sys.exit(1)
+        if not code_snippet:
+            ui.error("No code provided.")
+            sys.exit(1)
 
-    ui.code_block(code_snippet, title="your code", line_numbers=True)
+        ui.code_block(code_snippet, title="your code", line_numbers=True)
 
-    # Get description of issues
-    ui.section("Describe the issue", step="2/3")
-    issue_description = await ui.text_input(
-        "What should the validator detect in this code?",
-        default="Detect all potential issues",
-    )
+        # Get description of issues
+        ui.section("Describe the issue", step="2/3")
+        issue_description = await ui.text_input(
+            "What should the validator detect in this code?",
+            default=DEFAULT_ISSUE_DESCRIPTION,
+        )
 
-    # Get validator name
-    ui.section("Name the validator", step="3/3")
-    raw_validator_name = await ui.text_input(
-        "Validator name",
-        description="A short descriptive slug, e.g. unused-variable-detector",
-        default="custom_validator",
-    )
+        # Get validator name
+        ui.section("Name the validator", step="3/3")
+        raw_validator_name = await ui.text_input(
+            "Validator name",
+            description="A short descriptive slug, e.g. unused-variable-detector",
+            default=DEFAULT_VALIDATOR_NAME,
+        )
 
     validator_name = _format_validator_name(raw_validator_name)
 
@@ -72,8 +87,10 @@ async def new_validator_command(path: Path | None):
         ui.hint(f"formatted as {validator_name}")
 
     # Check if validator already exists
-    existing_validators = list(config_manager.get_custom_validators().values())
-    if any(v.name == validator_name for v in existing_validators):
+    if validator_name in config_manager.get_custom_validators():
+        if scripted:
+            ui.error(f"Validator '{validator_name}' already exists.")
+            sys.exit(1)
         if not await ui.confirm(f"Validator '{validator_name}' already exists. Overwrite?", default=False):
             ui.hint("cancelled")
             sys.exit(0)
@@ -85,7 +102,7 @@ async def new_validator_command(path: Path | None):
     ui.detail("detects", issue_description)
     console.print()
 
-    if not await ui.confirm("Create this validator?"):
+    if not scripted and not await ui.confirm("Create this validator?"):
         ui.hint("cancelled")
         sys.exit(0)
 
@@ -133,25 +150,44 @@ async def new_validator_command(path: Path | None):
         console.print()
 
         # Show preview of the validator
-        lines = validation_contents.split("\n")[:10]
-        preview = "\n".join(lines)
-        if len(validation_contents.split("\n")) > 10:
-            preview += "\n..."
-
-        ui.code_block(preview, title=validator_name)
+        ui.code_preview(validation_contents, title=validator_name)
 
     except Exception as e:
         console.print(f"[error]Error saving validator files: {e}[/error]")
 
 
+def _read_scripted_request() -> tuple[str, str, str]:
+    """
+    Read the code, issue description and validator name from one JSON object on stdin
+    """
+    try:
+        payload = json.loads(sys.stdin.read())
+    except json.JSONDecodeError as e:
+        ui.error(f"Expected a JSON object on stdin: {e}")
+        sys.exit(1)
+
+    if not isinstance(payload, dict):
+        ui.error("Expected a JSON object on stdin.")
+        sys.exit(1)
+
+    code = payload.get("code") or ""
+    issue_description = payload.get("issues") or DEFAULT_ISSUE_DESCRIPTION
+    validator_name = payload.get("name") or DEFAULT_VALIDATOR_NAME
+    if not all(isinstance(value, str) for value in (code, issue_description, validator_name)):
+        ui.error("Expected a JSON object on stdin with string code, issues and name fields.")
+        sys.exit(1)
+
+    return code.strip(), issue_description, validator_name
+
+
 def _format_validator_name(raw_validator_name: str) -> str:
     """
     Auto-format the name to be valid (replace spaces with hyphens, keep only valid chars)
     """
     # Replace spaces with hyphens, keep only letters, numbers, hyphens, and underscores
-    validator_name = re.sub(r'[^a-zA-Z0-9_-]', '-', raw_validator_name.strip())
+    validator_name = _INVALID_NAME_CHARS.sub('-', raw_validator_name.strip())
     # Replace multiple consecutive hyphens with single hyphen
-    validator_name = re.sub(r'-+', '-', validator_name)
+    validator_name = _REPEATED_HYPHENS.sub('-', validator_name)
     # Remove leading/trailing hyphens
     validator_name = validator_name.strip('-')
 
@@ -6,8 +6,9 @@ with real line editing (word jumps, kill-word, paste), and questionary-backed
 arrow-key menus.
 """
 
+import asyncio
 import sys
-from typing import AsyncGenerator, NoReturn
+from typing import TYPE_CHECKING, AsyncGenerator, NoReturn
 
 import questionary
 from prompt_toolkit import PromptSession
@@ -24,7 +25,10 @@ from rich.syntax import Syntax
 from rich.text import Text
 from rich.theme import Theme
 
-from determystic.agents.create_validator import StreamEvent
+if TYPE_CHECKING:
+    # Annotation-only: importing the agent module pulls in pydantic-ai, which
+    # commands like validate would otherwise pay for on every run.
+    from determystic.agents.create_validator import StreamEvent
 
 ACCENT = "#a78bfa"
 SUCCESS = "#34d399"
@@ -50,6 +54,12 @@ THEME = Theme({
 
 console = Console(theme=THEME)
 
+# Streamed model text is coalesced and written straight to the terminal once
+# this many characters (or a newline) have arrived, or after a short delay so
+# slow partial lines still appear promptly.
+TEXT_FLUSH_CHARS = 512
+TEXT_FLUSH_SECONDS = 0.05
+
 PROMPT_STYLE = PtStyle.from_dict({
     "prompt": f"{ACCENT} bold",
     "placeholder": f"{MUTED} italic",
@@ -113,15 +123,20 @@ def detail(label: str, value: str) -> None:
 
 def code_block(code: str, title: str | None = None, line_numbers: bool = False) -> None:
     """Render Python code in a subtle rounded frame on the terminal background."""
-    syntax = Syntax(
-        code,
-        "python",
-        theme="ansi_dark",
-        background_color="default",
-        line_numbers=line_numbers,
-    )
+    body: Syntax | Text
+    if console.is_terminal:
+        body = Syntax(
+            code,
+            "python",
+            theme="ansi_dark",
+            background_color="default",
+            line_numbers=line_numbers,
+        )
+    else:
+        # Colors are dropped when output is redirected, so skip Pygments lexing
+        body = Text(_number_lines(code) if line_numbers else code)
     console.print(Panel(
-        syntax,
+        body,
         box=box.ROUNDED,
         border_style="grey35",
         title=title,
@@ -130,6 +145,16 @@ def code_block(code: str, title: str | None = None, line_numbers: bool = False)
     ))
 
 
+def code_preview(code: str, title: str | None = None, max_lines: int = 10) -> None:
+    """Render the first ``max_lines`` lines of ``code``, marking when it was cut short."""
+    # maxsplit stops after the preview instead of splitting the whole file
+    lines = code.split("\n", max_lines)
+    preview = "\n".join(lines[:max_lines])
+    if len(lines) > max_lines:
+        preview += "\n..."
+    code_block(preview, title=title)
+
+
 async def text_input(
     label: str,
     *,
@@ -171,8 +196,12 @@ async def multiline_input(label: str, *, description: str | None = None) -> str:
     """Multiline input with bracketed paste support.
 
     Submits on a double Enter (an empty line following an empty line); returns
-    an empty string if the user interrupts the prompt.
+    an empty string if the user interrupts the prompt. When stdin is not a
+    terminal (piped input, CI), the whole stream is read in one call instead.
     """
+    if not sys.stdin.isatty():
+        return sys.stdin.read().strip()
+
     _print_input_label(label, description)
 
     session: PromptSession[str] = PromptSession(
@@ -247,28 +276,55 @@ async def confirm(label: str, *, default: bool = True) -> bool:
 
 
 async def render_agent_stream(
-    events: AsyncGenerator[StreamEvent, None],
-) -> StreamEvent | None:
+    events: AsyncGenerator["StreamEvent", None],
+) -> "StreamEvent | None":
     """Render agent stream events to the console and return the final event."""
-    final_event: StreamEvent | None = None
-    async for event in events:
-        if event.event_type == 'user_prompt':
-            console.print(Text.assemble(("● ", "accent"), (event.content, "")))
-        elif event.event_type == 'model_request_start':
-            console.print(Text(event.content, style="muted.italic"))
-        elif event.event_type == 'text_chunk':
-            # Print text chunks as they arrive
-            console.print(event.content, end="")
-        elif event.event_type == 'tool_processing_start':
-            console.print(Text(event.content, style="muted"))
-        elif event.event_type == 'tool_call_start':
-            console.print(Text(f"  → {event.content}", style="muted"))
-        elif event.event_type == 'tool_call_end':
-            console.print(Text.assemble(("  ✓ ", "success"), (event.content, "muted")))
-        elif event.event_type == 'final_result':
-            console.print()
-            success(event.content)
-            final_event = event
+    final_event: "StreamEvent | None" = None
+    text_buffer: list[str] = []
+    buffered_chars = 0
+    loop = asyncio.get_running_loop()
+    pending_flush: asyncio.TimerHandle | None = None
+
+    def flush_text() -> None:
+        nonlocal buffered_chars, pending_flush
+        if pending_flush is not None:
+            pending_flush.cancel()
+            pending_flush = None
+        if text_buffer:
+            console.file.write("".join(text_buffer))
+            console.file.flush()
+            text_buffer.clear()
+            buffered_chars = 0
+
+    try:
+        async for event in events:
+            if event.event_type == 'text_chunk':
+                # Coalesce token-sized chunks into a single plain write
+                text_buffer.append(event.content)
+                buffered_chars += len(event.content)
+                if buffered_chars >= TEXT_FLUSH_CHARS or "\n" in event.content:
+                    flush_text()
+                elif pending_flush is None:
+                    pending_flush = loop.call_later(TEXT_FLUSH_SECONDS, flush_text)
+                continue
+
+            flush_text()
+            if event.event_type == 'user_prompt':
+                console.print(Text.assemble(("● ", "accent"), (event.content, "")))
+            elif event.event_type == 'model_request_start':
+                console.print(Text(event.content, style="muted.italic"))
+            elif event.event_type == 'tool_processing_start':
+                console.print(Text(event.content, style="muted"))
+            elif event.event_type == 'tool_call_start':
+                console.print(Text(f"  → {event.content}", style="muted"))
+            elif event.event_type == 'tool_call_end':
+                console.print(Text.assemble(("  ✓ ", "success"), (event.content, "muted")))
+            elif event.event_type == 'final_result':
+                console.print()
+                success(event.content)
+                final_event = event
+    finally:
+        flush_text()
     return final_event
 
 
@@ -278,6 +334,12 @@ def _exit_cancelled() -> NoReturn:
     sys.exit(130)
 
 
+def _number_lines(code: str) -> str:
+    lines = code.split("\n")
+    width = len(str(len(lines)))
+    return "\n".join(f"{number:>{width}} {line}" for number, line in enumerate(lines, 1))
+
+
 def _print_input_label(label: str, description: str | None) -> None:
     console.print()
     console.print(Text(label, style="bold"))
@@ -16,6 +16,7 @@ from rich.text import Text
 from determystic.cli import ui
 from determystic.cli.common import get_active_validators
 from determystic.configs.project import ProjectConfigManager
+from determystic.io import run_async
 from determystic.project_discovery import ValidationTarget, discover_validation_targets
 from determystic.validators.base import BaseValidator, ValidationResult
 
@@ -38,7 +39,12 @@ class ValidationJob:
     is_flag=True,
     help="Show detailed output",
 )
-def validate_command(path: Path | None, verbose: bool):
+@click.option(
+    "--quiet",
+    is_flag=True,
+    help="Print one PASS/FAIL line per check, without the live display",
+)
+def validate_command(path: Path | None, verbose: bool, quiet: bool):
     """Run validation on a Python project."""
     # Note: This command doesn't require API configuration
 
@@ -54,7 +60,7 @@ def validate_command(path: Path | None, verbose: bool):
         ui.error(f"No pyproject.toml found for '{target_path}'.")
         sys.exit(1)
 
-    asyncio.run(_run_validation_targets(targets, verbose, target_path))
+    run_async(_run_validation_targets(targets, verbose, target_path, quiet=quiet))
 
 
 def _create_status_table(
@@ -63,9 +69,11 @@ def _create_status_table(
     *,
     include_scope: bool,
     durations: dict[str, float] | None = None,
+    summaries: dict[str, str] | None = None,
 ) -> Group:
     """Create the live checklist showing validation progress."""
     durations = durations or {}
+    summaries = summaries or {}
     renderables: list[RenderableType] = []
 
     grouped_jobs = _jobs_by_scope(jobs) if include_scope else {"": jobs}
@@ -92,8 +100,10 @@ def _create_status_table(
                     detail = Text.assemble(("no issues", "muted"), (duration, "muted"))
                 else:
                     icon = Text("✗", style="error")
-                    first_line = result.output.strip().split("\n")[0]
-                    detail = Text.assemble((first_line, "warning"), (duration, "muted"))
+                    summary = summaries.get(job.key)
+                    if summary is None:
+                        summary = _summary_line(result)
+                    detail = Text.assemble((summary, "warning"), (duration, "muted"))
             else:
                 icon = Spinner("dots", style="accent")
                 detail = Text("running…", style="muted")
@@ -109,6 +119,8 @@ async def _run_validation_targets(
     targets: list[ValidationTarget],
     verbose: bool,
     requested_path: Path,
+    *,
+    quiet: bool = False,
 ) -> None:
     """Run the validation process."""
     if not targets:
@@ -119,7 +131,8 @@ async def _run_validation_targets(
     subtitle = str(requested_path.absolute())
     if include_scope:
         subtitle += f" · {len(targets)} scopes"
-    ui.banner("validate", subtitle=subtitle)
+    if not quiet:
+        ui.banner("validate", subtitle=subtitle)
 
     jobs = _create_validation_jobs(targets, requested_path)
 
@@ -128,8 +141,15 @@ async def _run_validation_targets(
         ui.warning("No validators found to run.")
         return
 
+    if quiet:
+        if not await _run_quietly(jobs, include_scope=include_scope):
+            sys.exit(1)
+        return
+
     results: dict[str, ValidationResult] = {}
     durations: dict[str, float] = {}
+    # Failure summaries are computed once per job, not on every live refresh
+    summaries: dict[str, str] = {}
     started_at = time.monotonic()
 
     # Create live display
@@ -138,34 +158,32 @@ async def _run_validation_targets(
         console=console,
         refresh_per_second=12,
     ) as live:
-        # Run validation in parallel
-        tasks = []
-        for job in jobs:
-            async def run_and_store(current_job):
-                job_started_at = time.monotonic()
-                result = await current_job.validator.validate()
-                durations[current_job.key] = time.monotonic() - job_started_at
-                results[current_job.key] = result
-                # Update the live display immediately when a validator completes
-                live.update(
-                    _create_status_table(
-                        jobs,
-                        results,
-                        include_scope=include_scope,
-                        durations=durations,
-                    )
+        async def run_job(job: ValidationJob) -> tuple[ValidationJob, ValidationResult, float]:
+            job_started_at = time.monotonic()
+            result = await _validate_job(job)
+            return job, result, time.monotonic() - job_started_at
+
+        # Tasks start in creation order. Launch subprocess validators first so
+        # ruff and ty are already running while the AST validators hold the loop.
+        tasks = [asyncio.create_task(run_job(job)) for job in _launch_order(jobs)]
+
+        # Run validation in parallel, handling each result as soon as it lands
+        for completed in asyncio.as_completed(tasks):
+            job, result, duration = await completed
+            durations[job.key] = duration
+            results[job.key] = result
+            if not result.success:
+                summaries[job.key] = _summary_line(result)
+            # Update the live display immediately when a validator completes
+            live.update(
+                _create_status_table(
+                    jobs,
+                    results,
+                    include_scope=include_scope,
+                    durations=durations,
+                    summaries=summaries,
                 )
-                return current_job.key, result
-
-            tasks.append(run_and_store(job))
-
-        # Wait for all validations to complete
-        await asyncio.gather(*tasks)
-
-        # Final update to ensure all results are displayed
-        live.update(
-            _create_status_table(jobs, results, include_scope=include_scope, durations=durations)
-        )
+            )
 
     elapsed = time.monotonic() - started_at
     failed_count = sum(1 for result in results.values() if not result.success)
@@ -231,29 +249,67 @@ def _print_detailed_results(
     verbose: bool,
     include_scope: bool,
 ) -> None:
+    # Collect everything first so Rich renders the report in a single print
+    renderables: list[RenderableType] = []
     grouped_jobs = _jobs_by_scope(jobs) if include_scope else {"": jobs}
     for scope, scope_jobs in grouped_jobs.items():
         if include_scope:
-            console.print()
-            console.print(Text.assemble(("▸ ", "accent"), (scope, "bold")))
+            renderables.append(Text(""))
+            renderables.append(Text.assemble(("▸ ", "accent"), (scope, "bold")))
 
         for job in scope_jobs:
             result = results[job.key]
             validator_display = job.validator.display_name
+            output = result.output.strip()
 
             if result.success:
                 if verbose:  # Only show passed validators in verbose mode
-                    console.print()
-                    console.print(Text.assemble(("✓ ", "success"), (validator_display, "bold")))
-                    if result.output.strip():
-                        console.print(Text(result.output.strip(), style="muted"))
+                    renderables.append(Text(""))
+                    renderables.append(Text.assemble(("✓ ", "success"), (validator_display, "bold")))
+                    if output:
+                        renderables.append(Text(output, style="muted"))
             else:
-                console.print()
-                console.print(Text.assemble(("✗ ", "error"), (validator_display, "bold")))
-                if result.output.strip():
+                renderables.append(Text(""))
+                renderables.append(Text.assemble(("✗ ", "error"), (validator_display, "bold")))
+                if output:
                     # Indent the output for better readability
-                    for line in result.output.strip().split("\n"):
-                        console.print(f"  {line}")
+                    renderables.append(Text("\n".join(f"  {line}" for line in output.split("\n"))))
+
+    if renderables:
+        console.print(Group(*renderables))
+
+
+async def _run_quietly(jobs: list[ValidationJob], *, include_scope: bool) -> bool:
+    """Run every job and print plain PASS/FAIL lines, skipping all Rich rendering."""
+    ordered = _launch_order(jobs)
+    completed = await asyncio.gather(*(_validate_job(job) for job in ordered))
+    results = {job.key: result for job, result in zip(ordered, completed)}
+
+    for job in jobs:
+        result = results[job.key]
+        name = job.validator.display_name
+        if include_scope:
+            name = f"{job.target_label} / {name}"
+        print(f"{'PASS' if result.success else 'FAIL'} {name}")
+        if not result.success and result.output.strip():
+            sys.stderr.write(result.output.strip() + "\n")
+
+    return all(result.success for result in completed)
+
+
+async def _validate_job(job: ValidationJob) -> ValidationResult:
+    """Run one validator, reporting a crash as a failed check instead of aborting the run."""
+    try:
+        return await job.validator.validate()
+    except Exception as e:
+        return ValidationResult(
+            success=False,
+            output=f"Unexpected error running validator: {type(e).__name__}: {e}",
+        )
+
+
+def _launch_order(jobs: list[ValidationJob]) -> list[ValidationJob]:
+    return sorted(jobs, key=lambda job: not job.validator.launches_subprocess)
 
 
 def _jobs_by_scope(jobs: list[ValidationJob]) -> dict[str, list[ValidationJob]]:
@@ -263,6 +319,11 @@ def _jobs_by_scope(jobs: list[ValidationJob]) -> dict[str, list[ValidationJob]]:
     return grouped_jobs
 
 
+def _summary_line(result: ValidationResult) -> str:
+    # partition stops at the first newline instead of splitting the whole log
+    return result.output.strip().partition("\n")[0]
+
+
 def _format_duration(seconds: float | None) -> str:
     if seconds is None:
         return ""
@@ -6,10 +6,13 @@ validators should use for consistent error reporting and validation results.
 
 import ast
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, Callable, ClassVar, Iterator, TypeVar
 
 from pydantic import BaseModel
 
+NodeT = TypeVar("NodeT", bound=ast.AST)
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 @dataclass
 class ValidationIssue:
@@ -106,6 +109,27 @@ def find_pattern_in_code(code: str, pattern: str, filename: str = "<string>") ->
     return issues
 
 
+def jit(func: F) -> F:  # determystic: used
+    """
+    Compile a pure-numeric helper with Numba when it's installed.
+    
+    Only worth applying to hot loops over numbers (scores, offsets, counts);
+    AST walking itself can't run in nopython mode. Without Numba the function
+    is returned unchanged, so validators using it still run everywhere.
+    
+    Args:
+        func: The numeric helper to compile
+        
+    Returns:
+        The compiled function, or ``func`` itself when Numba is unavailable
+    """
+    try:
+        import numba  # ty: ignore[unresolved-import]
+    except ImportError:
+        return func
+    return numba.njit(cache=True)(func)
+
+
 def _create_issue_with_context(
     code: str, 
     line_number: int, 
@@ -154,6 +178,20 @@ def _create_issue_with_context(
     )
 
 
+# Node types that never appear below an expression. A traverser whose
+# visitors only target these can skip expression subtrees without missing
+# a single callback.
+_STATEMENT_LEVEL_NODES = (
+    ast.mod,
+    ast.stmt,
+    ast.excepthandler,
+    ast.alias,
+    ast.withitem,
+    ast.match_case,
+    ast.pattern,
+)
+
+
 class DeterministicTraverser(ast.NodeVisitor):
     """Base class for all determystic AST validators.
     
@@ -161,8 +199,46 @@ class DeterministicTraverser(ast.NodeVisitor):
     validation errors with proper line numbers and code context.
     Set ``config_model`` to a Pydantic ``BaseModel`` subclass to receive typed
     project configuration from ``[tool.determystic.validators.<name>.config]``.
+
+    ``visit_*`` methods are dispatched through a lookup table keyed by node
+    type instead of a ``getattr`` per visited node. The table is computed once
+    per subclass when the class is created, so traversers should define
+    ``visit_*`` methods rather than override ``visit``. Set
+    ``statements_only = True`` when the validator only inspects statement
+    nodes (imports, definitions, try blocks) to skip walking expression
+    subtrees entirely. This is also inferred automatically when every
+    ``visit_*`` method targets a statement-level node type.
     """
     config_model: ClassVar[type[BaseModel] | None] = None
+    statements_only: ClassVar[bool] = False
+    _visitor_table: ClassVar[dict[type[ast.AST], str]] = {}
+    _skip_expressions: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Map each ``visit_*`` method on the subclass to its AST node type."""
+        super().__init_subclass__(**kwargs)
+        table: dict[type[ast.AST], str] = {}
+        for name in dir(cls):
+            if not name.startswith("visit_"):
+                continue
+            node_type = getattr(ast, name.removeprefix("visit_"), None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                table[node_type] = name
+        cls._visitor_table = table
+        # Legacy visitors inherited from ast.NodeVisitor don't count
+        own_node_types = [
+            node_type
+            for node_type, name in table.items()
+            if getattr(cls, name) is not getattr(ast.NodeVisitor, name, None)
+        ]
+        # Only infer skipping when every callback is a statement-level visit_*;
+        # custom visit/generic_visit overrides may inspect any node
+        cls._skip_expressions = cls.statements_only or (
+            bool(own_node_types)
+            and cls.visit is DeterministicTraverser.visit
+            and cls.generic_visit is DeterministicTraverser.generic_visit
+            and all(issubclass(node_type, _STATEMENT_LEVEL_NODES) for node_type in own_node_types)
+        )
     
     def __init__(
         self,
@@ -182,7 +258,60 @@ class DeterministicTraverser(ast.NodeVisitor):
         self.config = config
         self.errors: list[ValidationIssue] = []
         self._lines = code.split('\n')
+        self._visitors: dict[type[ast.AST], Callable[[Any], Any]] = {
+            node_type: getattr(self, name)
+            for node_type, name in self._visitor_table.items()
+        }
+
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node through the cached ``visit_*`` lookup table."""
+        node_type = type(node)
+        visitor = self._visitors.get(node_type)
+        if visitor is None:
+            visitor = self._resolve_visitor(node_type)
+        return visitor(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit all child nodes, skipping expressions for ``statements_only`` traversers."""
+        skip_expressions = self._skip_expressions
+        if type(self).visit is not DeterministicTraverser.visit:
+            # Subclasses that override visit (e.g. to track parents) must see every node
+            for child in ast.iter_child_nodes(node):
+                if skip_expressions and isinstance(child, ast.expr):
+                    continue
+                self.visit(child)
+            return
+
+        visitors = self._visitors
+        for child in ast.iter_child_nodes(node):
+            if skip_expressions and isinstance(child, ast.expr):
+                continue
+            visitor = visitors.get(type(child))
+            if visitor is None:
+                visitor = self._resolve_visitor(type(child))
+            visitor(child)
     
+    def walk_of_types(  # determystic: used
+        self,
+        node: ast.AST,
+        types: tuple[type[NodeT], ...],
+    ) -> Iterator[NodeT]:
+        """Yield every node below ``node`` (inclusive) matching ``types``, in source order.
+
+        Walks iteratively with an explicit stack, so simple "find all X" checks
+        avoid a Python frame per node from ``visit_*`` recursion.
+
+        Args:
+            node: The node to start from, usually the parsed module
+            types: Node types to yield
+        """
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, types):
+                yield current
+            stack.extend(reversed(list(ast.iter_child_nodes(current))))
+
     def add_error(  # determystic: used
         self, 
         node: ast.AST, 
@@ -240,6 +369,12 @@ class DeterministicTraverser(ast.NodeVisitor):
             message=None if len(self.errors) == 0 else f"Found {len(self.errors)} issue(s)"
         )
 
+    def _resolve_visitor(self, node_type: type[ast.AST]) -> Callable[[Any], Any]:
+        """Look up and cache the visitor method for a node type."""
+        visitor = getattr(self, f"visit_{node_type.__name__}", self.generic_visit)
+        self._visitors[node_type] = visitor
+        return visitor
+
     def _add_error_at_line(
         self,
         line_number: int,
@@ -2,6 +2,7 @@
 
 import asyncio
 import subprocess
+import sys
 from pathlib import Path
 from typing import Optional, Callable, Coroutine, Any, TypeVar, ParamSpec
 from functools import wraps
@@ -88,8 +89,58 @@ def get_determystic_package_path() -> Path:
 def async_to_sync(async_fn: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, T]:
     @wraps(async_fn)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(async_fn(*args, **kwargs))
-        return result
+        return run_async(async_fn(*args, **kwargs))
 
     return wrapper
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop, like ``asyncio.run``.
+    
+    The loop comes from ``_new_event_loop`` so CLI entrypoints pick up uvloop
+    when it's installed.
+    
+    Args:
+        coro: The coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    if sys.version_info >= (3, 11):
+        # Runner handles teardown and debug mode exactly as asyncio.run does
+        with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+            return runner.run(coro)
+
+    loop = _new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            _cancel_pending_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+def _cancel_pending_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel and drain tasks the coroutine left behind, as ``asyncio.run`` does."""
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop for running our async entrypoints.
+
+    The agent streams are dominated by fine-grained awaits, so we prefer uvloop
+    when it's installed (`pip install determystic[perf]`) and otherwise fall
+    back to the stock asyncio loop.
+    """
+    try:
+        import uvloop  # ty: ignore[unresolved-import]
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
@@ -1,5 +1,6 @@
 """Isolated environment runner for agent test execution."""
 
+import hashlib
 import json
 import os
 import shutil
@@ -10,6 +11,10 @@ from typing import Optional
 
 from determystic.io import get_determystic_package_path
 
+# Upper bound on the test output handed back to the agent. Pytest prints the
+# failure summary last, so longer output keeps its tail.
+MAX_OUTPUT_CHARS = 64_000
+
 
 class IsolatedEnv:
     """Runner for executing agent-generated tests in an isolated temporary environment."""
@@ -22,6 +27,16 @@ class IsolatedEnv:
         """
         self.determystic_package_path = get_determystic_package_path()
         self.temp_dir: Optional[Path] = None
+        # Digest of the last content written to each package file, so repeated
+        # runs only touch files that actually changed.
+        self._written_digests: dict[Path, bytes] = {}
+        # Whether uv has already synced the package's virtualenv. The
+        # dependencies never change within one environment, so later runs
+        # skip uv's lockfile resolution and sync step.
+        self._synced = False
+        # Whether the most recent run_tests call got a pytest verdict, as
+        # opposed to timing out or failing before pytest ran.
+        self.last_run_completed = False
         
     def __enter__(self):
         """Context manager entry - create temp directory."""
@@ -31,7 +46,9 @@ class IsolatedEnv:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - cleanup temp directory."""
         if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+            # Best effort: a stray pytest cache file must not turn a finished
+            # agent run into a failure
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def run_tests(self, validator_code: str, test_code: str) -> tuple[bool, str]:
         """Run the agent-generated tests in an isolated environment.
@@ -43,13 +60,15 @@ class IsolatedEnv:
         Returns:
             Tuple of (success, output) where success indicates if tests passed
         """
+        self.last_run_completed = False
         try:
             # Create the temporary package
             package_dir = self._create_test_package(validator_code, test_code)
             env = self._subprocess_env()
             
+            sync_args = ["--no-sync"] if self._synced else []
             result = subprocess.run(
-                ["uv", "run", "pytest", "test_validator.py", "-v"],
+                ["uv", "run", *sync_args, "pytest", "test_validator.py", "-v"],
                 cwd=package_dir,
                 env=env,
                 capture_output=True,
@@ -57,11 +76,20 @@ class IsolatedEnv:
                 timeout=30
             )
             
+            # Pytest only reports passed (0) or failed (1) tests once the
+            # environment was installed successfully
+            if result.returncode in (0, 1):
+                self._synced = True
+                self.last_run_completed = True
+
             # Return success status and combined output
             success = result.returncode == 0
             output = result.stdout + "\n" + result.stderr if result.stderr else result.stdout
+            output = output.strip()
+            if len(output) > MAX_OUTPUT_CHARS:
+                output = "...[truncated]\n" + output[-MAX_OUTPUT_CHARS:]
             
-            return success, output.strip()
+            return success, output
             
         except subprocess.TimeoutExpired:
             return False, "Test execution timed out"
@@ -81,9 +109,10 @@ class IsolatedEnv:
         if not self.temp_dir:
             raise RuntimeError("IsolatedEnv must be used as a context manager")
 
-        # Create package structure
+        # Create package structure; the package is rewritten in place when
+        # the same environment runs the tests again.
         package_dir = self.temp_dir / "temp_validator"
-        package_dir.mkdir(parents=True)
+        package_dir.mkdir(parents=True, exist_ok=True)
 
         dependency_specs = self._dependency_specs()
         dependency_lines = ",\n".join(f"    {json.dumps(spec)}" for spec in dependency_specs)
@@ -104,16 +133,28 @@ dependencies = [
 where = ["."]
 '''
 
-        (package_dir / "pyproject.toml").write_text(pyproject_content)
+        self._write_if_changed(package_dir / "pyproject.toml", pyproject_content)
 
         # Create the validator module
-        (package_dir / "validator.py").write_text(validator_code)
+        self._write_if_changed(package_dir / "validator.py", validator_code)
 
         # Create test module
-        (package_dir / "test_validator.py").write_text(test_code)
+        self._write_if_changed(package_dir / "test_validator.py", test_code)
 
         return package_dir
 
+    def _write_if_changed(self, path: Path, content: str) -> None:
+        """Write content to path unless the same content was already written there.
+
+        Leaving unchanged files untouched keeps their mtimes stable, so pytest's
+        bytecode cache stays warm across runs in the same environment.
+        """
+        digest = hashlib.blake2b(content.encode()).digest()
+        if self._written_digests.get(path) == digest and path.exists():
+            return
+        path.write_text(content)
+        self._written_digests[path] = digest
+
     def _has_installable_determystic_source(self) -> bool:
         """Return whether the resolved path can be installed as a Python project."""
         root = self.determystic_package_path
@@ -21,6 +21,9 @@ class ValidationResult:
 class BaseValidator(ABC):
     """Abstract base class for all validators."""
     config_model: ClassVar[type[BaseModel] | None] = None
+    # Validators that shell out to an external process; these are started
+    # first so their subprocesses overlap with in-process AST validators.
+    launches_subprocess: ClassVar[bool] = False
     
     def __init__(
         self,
@@ -16,6 +16,7 @@ class StaticAnalysisValidator(BaseValidator):
     the validated output for each file.
     
     """
+    launches_subprocess = True
     
     def __init__(self, path: Path, command: list[str]) -> None:
         super().__init__(name="static_analysis", path=path)